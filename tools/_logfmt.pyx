@@ -0,0 +1,39 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+C helper for the log receiver's per-line output formatting
+Build: cd tools && python setup.py build_ext --inplace
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize, PyBytes_GET_SIZE
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE
+from libc.string cimport memcpy
+
+
+def format_line(bytes timestamp, bytes prefix, message):
+    """Return b"[<timestamp>] <prefix><message>\\n" built in a single allocation"""
+    cdef const char* msg
+    cdef Py_ssize_t msg_len
+    if isinstance(message, bytearray):
+        msg = PyByteArray_AS_STRING(message)
+        msg_len = PyByteArray_GET_SIZE(message)
+    else:
+        message = bytes(message)
+        msg = PyBytes_AS_STRING(message)
+        msg_len = PyBytes_GET_SIZE(message)
+    
+    cdef Py_ssize_t ts_len = PyBytes_GET_SIZE(timestamp)
+    cdef Py_ssize_t prefix_len = PyBytes_GET_SIZE(prefix)
+    cdef bytes line = PyBytes_FromStringAndSize(NULL, ts_len + prefix_len + msg_len + 4)
+    cdef char* out = PyBytes_AS_STRING(line)
+    
+    out[0] = b'['
+    memcpy(out + 1, PyBytes_AS_STRING(timestamp), ts_len)
+    out += ts_len + 1
+    out[0] = b']'
+    out[1] = b' '
+    out += 2
+    memcpy(out, PyBytes_AS_STRING(prefix), prefix_len)
+    out += prefix_len
+    memcpy(out, msg, msg_len)
+    out[msg_len] = b'\n'
+    return line
@@ -8,10 +8,15 @@ import socket
 import sys
 import signal
 import argparse
+import errno
+import io
+import os
 import threading
 import queue
+import selectors
 import time
-from datetime import datetime
+from collections import deque
+from itertools import product
 
 try:
     import curses
@@ -19,65 +24,404 @@ try:
 except ImportError:
     CURSES_AVAILABLE = False
 
+try:
+    import liburing
+    IO_URING_AVAILABLE = True
+except ImportError:
+    IO_URING_AVAILABLE = False
+
+# Interactive mode: lines of history kept, and the widest line rendered
+LOG_HISTORY = 1000
+PAD_WIDTH = 512
+
+# Bytes read per recv() and kernel receive buffer requested per client
+RECV_SIZE = 65536
+SO_RCVBUF_SIZE = 1 << 20
+MAX_LINE_LENGTH = 1 << 20  # Longer unterminated lines are written out in pieces
+
+# Lines buffered between the network and the writer before the oldest are dropped
+RING_SIZE = 200_000
+
+# Log file lines are gathered into writev() calls of at most IOV_MAX fragments
+WRITEV_AVAILABLE = hasattr(os, 'writev')
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+WRITEV_BYTES = 65536
+
+# Multiple worker processes share the port through SO_REUSEPORT (Linux, BSD)
+REUSEPORT_AVAILABLE = hasattr(socket, 'SO_REUSEPORT') and hasattr(os, 'fork')
+
+# A run of identical lines is reported as one count at least this often (seconds)
+REPEAT_REPORT_INTERVAL = 1.0
+
+# Linux only; the kernel clears it again after each delayed-ACK decision
+TCP_QUICKACK = getattr(socket, 'TCP_QUICKACK', None)
+
+# Local UTC offset, refreshed once a minute so DST changes are picked up
+_tz_minute = None
+_tz_offset_ms = 0
+
+
+def _local_ms_of_day(ns):
+    """Milliseconds since local midnight for a time.time_ns() value"""
+    global _tz_minute, _tz_offset_ms
+    minute = ns // 60_000_000_000
+    if minute != _tz_minute:
+        _tz_offset_ms = time.localtime(ns // 1_000_000_000).tm_gmtoff * 1000
+        _tz_minute = minute
+    return (ns // 1_000_000 + _tz_offset_ms) % 86_400_000
+
+
+# Pre-rendered timestamp pieces, so formatting is three lookups and two concatenations
+_HOUR_MINUTE = [b"%02d:%02d:" % divmod(i, 60) for i in range(1440)]
+_TWO_DIGITS = [b"%02d" % i for i in range(100)]
+_MILLIS = [b".%03d" % i for i in range(1000)]
+
+
+def _fmt_ts(ns):
+    """Format a time.time_ns() value as local HH:MM:SS.mmm bytes"""
+    minute, rem = divmod(_local_ms_of_day(ns), 60_000)
+    s, ms = divmod(rem, 1000)
+    return _HOUR_MINUTE[minute] + _TWO_DIGITS[s] + _MILLIS[ms]
+
+
+def _format_line(timestamp, prefix, message):
+    """Build a full output line (pure-Python version of _logfmt.format_line)"""
+    return b"[%s] %s%s\n" % (timestamp, prefix, message)
+
+
+def _make_display_formatter(show_timestamp, show_ip, show_port, show_microseconds):
+    """Build the interactive line formatter for one combination of display toggles"""
+    cut = 12 if show_microseconds else 8  # HH:MM:SS.mmm or HH:MM:SS
+    if show_timestamp:
+        if show_ip and show_port:
+            return lambda ts, ip, port, msg: "[%s] [%s:%d] %s" % (ts[:cut], ip, port, msg)
+        if show_ip:
+            return lambda ts, ip, port, msg: "[%s] [%s] %s" % (ts[:cut], ip, msg)
+        if show_port:
+            return lambda ts, ip, port, msg: "[%s] [:%d] %s" % (ts[:cut], port, msg)
+        return lambda ts, ip, port, msg: "[%s] %s" % (ts[:cut], msg)
+    if show_ip and show_port:
+        return lambda ts, ip, port, msg: "[%s:%d] %s" % (ip, port, msg)
+    if show_ip:
+        return lambda ts, ip, port, msg: "[%s] %s" % (ip, msg)
+    if show_port:
+        return lambda ts, ip, port, msg: "[:%d] %s" % (port, msg)
+    return lambda ts, ip, port, msg: msg
+
+
+# (show_timestamp, show_ip, show_port, show_microseconds) -> formatter
+_DISPLAY_FORMATTERS = {flags: _make_display_formatter(*flags)
+                       for flags in product((False, True), repeat=4)}
+
+
+# Optional C formatter, built with: cd tools && python setup.py build_ext --inplace
+try:
+    from _logfmt import format_line
+except ImportError:
+    format_line = _format_line
+
+
+class ClientConnection:
+    """Per-connection state kept by the selector loop"""
+    def __init__(self, sock, addr):
+        self.sock = sock
+        self.addr = addr
+        self.prefix = f"[{addr[0]}:{addr[1]}] ".encode()
+        self.buf = bytearray()  # Partial line carried over between recv() calls
+        
+        # Consecutive duplicate suppression
+        self.last_line = b""
+        self.repeat = 0
+        self.repeat_since = 0.0
+
+
+class UringServer:
+    """io_uring accept/recv loop (Linux, optional liburing bindings)
+    
+    One multishot accept on the listener and one multishot recv per client,
+    reading into kernel-selected provided buffers. The ring fd is waited on
+    through selectors because the bindings hold the GIL while blocking.
+    """
+    ENTRIES = 256
+    BUFFERS = 64
+    BUFFER_SIZE = RECV_SIZE
+    BUFFER_GROUP = 1
+    ACCEPT_TAG = 0
+    PROVIDE_TAG = 1 << 62
+    CANCEL_TAG = PROVIDE_TAG + 1
+    
+    def __init__(self, receiver):
+        self.receiver = receiver
+        self.ring = liburing.Ring()
+        liburing.io_uring_queue_init(self.ENTRIES, self.ring)  # OSError without io_uring
+        self.cqe = liburing.Cqe()
+        self.buffers = [bytearray(self.BUFFER_SIZE) for _ in range(self.BUFFERS)]
+        self.clients = {}  # recv tag -> ClientConnection
+        self.next_tag = 1  # Tags are never reused, so late completions can't hit a new client
+    
+    def get_sqe(self):
+        """Get a submission entry, submitting first if the queue is full"""
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        if sqe is None:
+            liburing.io_uring_submit(self.ring)
+            sqe = liburing.io_uring_get_sqe(self.ring)
+        return sqe
+    
+    def provide_buffer(self, bid):
+        """Hand a receive buffer (back) to the kernel"""
+        sqe = self.get_sqe()
+        liburing.io_uring_prep_provide_buffers(sqe, self.buffers[bid], 1, self.BUFFER_GROUP, bid)
+        liburing.io_uring_sqe_set_data64(sqe, self.PROVIDE_TAG)
+    
+    def arm_accept(self):
+        """Queue a multishot accept on the listening socket"""
+        sqe = self.get_sqe()
+        liburing.io_uring_prep_multishot_accept(sqe, self.receiver.socket.fileno())
+        liburing.io_uring_sqe_set_data64(sqe, self.ACCEPT_TAG)
+    
+    def arm_recv(self, tag):
+        """Queue a multishot recv on a client, reading into provided buffers"""
+        sqe = self.get_sqe()
+        liburing.io_uring_prep_recv_multishot(sqe, self.clients[tag].sock.fileno())
+        liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_BUFFER_SELECT)
+        liburing.io_uring_sqe_set_buf_group(sqe, self.BUFFER_GROUP)
+        liburing.io_uring_sqe_set_data64(sqe, tag)
+    
+    def cancel_recv(self, tag):
+        """Cancel a client's multishot recv"""
+        sqe = self.get_sqe()
+        liburing.io_uring_prep_cancel64(sqe, tag, 0)
+        liburing.io_uring_sqe_set_data64(sqe, self.CANCEL_TAG)
+    
+    def run(self):
+        """Run until the receiver stops"""
+        for bid in range(self.BUFFERS):
+            self.provide_buffer(bid)
+        self.arm_accept()
+        
+        sel = selectors.DefaultSelector()
+        sel.register(self.ring.ring_fd, selectors.EVENT_READ)
+        sel.register(self.receiver._wakeup_r, selectors.EVENT_READ)
+        try:
+            while self.receiver.running:
+                liburing.io_uring_submit(self.ring)
+                for key, _ in sel.select(timeout=0.1):
+                    if key.fileobj is self.receiver._wakeup_r:
+                        self.receiver.handle_wakeup()
+                    else:
+                        self.reap()
+                self.receiver.report_repeats()
+        finally:
+            sel.close()
+            for conn in self.clients.values():
+                self.receiver.close_client(conn)
+            self.clients.clear()
+            liburing.io_uring_queue_exit(self.ring)
+    
+    def reap(self):
+        """Handle every completion currently in the queue"""
+        seen = 0
+        cqe_iter = liburing.io_uring_cqe_iter_init(self.ring)
+        while liburing.io_uring_cqe_iter_next(cqe_iter, self.cqe):
+            seen += 1
+            entry = self.cqe[0]
+            try:
+                res = entry.res
+            except OSError as e:
+                res = -e.errno
+            self.complete(entry.user_data, res, entry.flags)
+        liburing.io_uring_cq_advance(self.ring, seen)
+    
+    def complete(self, tag, res, flags):
+        """Dispatch a single completion"""
+        more = flags & liburing.IORING_CQE_F_MORE
+        if tag == self.PROVIDE_TAG or tag == self.CANCEL_TAG:
+            return
+        
+        if tag == self.ACCEPT_TAG:
+            if res >= 0:
+                client_socket = socket.socket(fileno=res)
+                try:
+                    client_addr = client_socket.getpeername()
+                except OSError:
+                    client_socket.close()
+                else:
+                    self.receiver.register_client(client_socket, client_addr)
+                    tag = self.next_tag
+                    self.next_tag += 1
+                    self.clients[tag] = ClientConnection(client_socket, client_addr)
+                    self.arm_recv(tag)
+            if not more:
+                self.arm_accept()
+            return
+        
+        conn = self.clients.get(tag)
+        if conn is None:
+            # Late completion of a closed client - just take its buffer back
+            if flags & liburing.IORING_CQE_F_BUFFER:
+                self.provide_buffer(flags >> liburing.IORING_CQE_BUFFER_SHIFT)
+            return
+        
+        if res > 0 and flags & liburing.IORING_CQE_F_BUFFER:
+            bid = flags >> liburing.IORING_CQE_BUFFER_SHIFT
+            ok = self.receiver.client_data(conn, memoryview(self.buffers[bid])[:res])
+            self.provide_buffer(bid)
+            if ok:
+                self.receiver.quickack(conn)
+                if not more:
+                    self.arm_recv(tag)
+                return
+        elif res == -errno.ENOBUFS:
+            self.arm_recv(tag)  # Buffers are re-provided as completions are handled
+            return
+        
+        # EOF, error, or processing failure - drop the client now, even if the
+        # multishot recv is still armed (its remaining completions are ignored)
+        del self.clients[tag]
+        if more:
+            self.cancel_recv(tag)
+        self.receiver.close_client(conn)
+
 
 class LogReceiver:
-    def __init__(self, host='127.0.0.1', port=9000, interactive=False, log_file=None):
+    def __init__(self, host='127.0.0.1', port=9000, interactive=False, log_file=None,
+                 write_period=0.1, fsync=False, io_uring=False, workers=1):
         self.host = host
         self.port = port
         self.socket = None
+        self._recv_view = None  # Shared recv_into() buffer of the selector loop
         self.running = True
         self.interactive = interactive
         self.log_file = log_file
+        self.write_period = write_period
+        self.fsync = fsync
+        self.io_uring = io_uring and IO_URING_AVAILABLE
+        self.workers = workers if REUSEPORT_AVAILABLE and not interactive else 1
+        self._children = []  # Worker pids, only populated in the parent
         
         # Display toggles (interactive mode)
         self.show_timestamp = True
         self.show_ip = True
         self.show_port = True
         self.show_microseconds = True
+        self._fmt_fn = _DISPLAY_FORMATTERS[True, True, True, True]
         
-        # For interactive mode
-        self.log_queue = queue.Queue()
+        # Fixed interface text, rebuilt only on toggles and resizes
+        self._cached_header = f"Log Receiver - {self.host}:{self.port}"
+        self._cached_controls = self.build_controls()
+        self._cached_sep = ""
+        self._sep_width = 0
+        
+        # For interactive mode - carries lists of entries, one per received chunk
+        self.log_queue = queue.SimpleQueue()
         self.stdscr = None
+        self._pad = None       # Rendered log lines, blitted into the log region
+        self._pad_rows = 0
+        self._dirty = True     # Screen needs a redraw
+        self._notify_r = self._notify_w = None
+        if interactive:
+            # The consumer pokes this after queueing lines so the UI wakes up for them
+            self._notify_r, self._notify_w = socket.socketpair()
+            self._notify_r.setblocking(False)
+            self._notify_w.setblocking(False)
+        
+        # Signals write to this pair and the loops shut down when it becomes readable
+        self._wakeup_r = self._wakeup_w = None
+        self._old_wakeup_fd = None  # Restored by stop()
+        self.open_wakeup()
+        
+        # Batched stdout (simple mode) - one write() per flush instead of per line
+        self._stdout = io.BufferedWriter(
+            io.FileIO(sys.stdout.fileno(), 'wb', closefd=False), 65536)
+        self._stdout_ok = True      # Cleared once stdout's reader goes away
+        self._failed_sinks = set()  # Outputs whose current failure was already reported
+        
+        # Received lines wait here for the consumer thread, which formats and writes them
+        self._ring = deque(maxlen=RING_SIZE)
+        self._ring_lock = threading.Lock()
+        self._ring_cv = threading.Condition(self._ring_lock)
+        self._dropped = 0
+        self._consumer_thread = None
+        self._consuming = True     # Cleared by stop() once the network side has finished
+        self._server_thread = None  # Interactive mode serves clients on a background thread
+        self._repeating = set()  # Connections with an unreported run of duplicates
+        
+        # Log file stays open for the whole run, flushed every write_period.
+        # With writev() line fragments are gathered by the kernel instead of
+        # being joined into a user-space buffer first.
+        self._logfh = None
+        self._logbuf = None
+        self._iov = None      # Pending writev() fragments
+        self._iov_bytes = 0
+        if self.log_file:
+            self._logfh = open(self.log_file, 'ab', buffering=0)
+            if WRITEV_AVAILABLE:
+                self._iov = []
+            else:
+                self._logbuf = io.BufferedWriter(self._logfh, 65536)
         
     def start(self):
         """Start the log receiver server"""
+        sys.stdout.flush()  # Earlier prints go first, and aren't duplicated into workers
+        if self.workers > 1:
+            self.fork_workers()
+        
+        self._consumer_thread = threading.Thread(target=self.consume_loop)
+        self._consumer_thread.daemon = True
+        self._consumer_thread.start()
+        
         if self.interactive and CURSES_AVAILABLE:
             self.start_interactive()
         else:
             self.start_simple()
     
+    def fork_workers(self):
+        """Fork workers-1 copies of this process, each serving the port on its own socket"""
+        for _ in range(self.workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                self._children = []
+                self.open_wakeup()  # Signals to this worker must not wake the others
+                return
+            self._children.append(pid)
+    
+    def open_wakeup(self):
+        """Create the signal wakeup pair and point signal.set_wakeup_fd at it"""
+        if self._wakeup_r:
+            self._wakeup_r.close()
+            self._wakeup_w.close()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
+        if threading.current_thread() is threading.main_thread():
+            old_fd = signal.set_wakeup_fd(self._wakeup_w.fileno())
+            if self._old_wakeup_fd is None:
+                self._old_wakeup_fd = old_fd
+    
+    def handle_wakeup(self):
+        """A signal arrived - stop the loops without raising out of the handler"""
+        try:
+            signums = self._wakeup_r.recv(64)
+        except BlockingIOError:
+            return
+        signums = signums.replace(b"\0", b"")  # Zero bytes are stop()'s own wakeups
+        if signums and not self.interactive:
+            self.status(f"\nReceived signal {signums[0]}")
+        self.running = False
+    
     def start_simple(self):
         """Start in simple mode (original behavior)"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind((self.host, self.port))
-            self.socket.listen(5)
-            
-            print(f"Log receiver listening on {self.host}:{self.port}")
-            
-            while self.running:
-                try:
-                    client_socket, client_addr = self.socket.accept()
-                    print(f"Connection from {client_addr[0]}:{client_addr[1]}")
-                    
-                    # Handle client in thread for simple mode
-                    client_thread = threading.Thread(
-                        target=self.handle_client, 
-                        args=(client_socket, client_addr)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                    
-                except socket.error as e:
-                    if self.running:
-                        print(f"Socket error: {e}")
-                    break
+            self.open_server_socket()
+            worker = f" (worker {os.getpid()})" if self.workers > 1 else ""
+            self.status(f"Log receiver listening on {self.host}:{self.port}{worker}")
+            self.run_loop()
                     
-        except KeyboardInterrupt:
-            print("\nShutdown requested")
         except Exception as e:
-            print(f"Server error: {e}")
+            self.status(f"Server error: {e}")
         finally:
             self.stop()
     
@@ -85,8 +429,6 @@ class LogReceiver:
         """Start in interactive curses mode"""
         try:
             curses.wrapper(self.interactive_main)
-        except KeyboardInterrupt:
-            pass
         finally:
             self.stop()
     
@@ -95,198 +437,590 @@ class LogReceiver:
         self.stdscr = stdscr
         curses.curs_set(0)  # Hide cursor
         stdscr.nodelay(1)   # Non-blocking input
-        stdscr.timeout(100) # 100ms timeout for getch()
         
         # Start server in background thread
-        server_thread = threading.Thread(target=self.run_server)
-        server_thread.daemon = True
-        server_thread.start()
+        self._server_thread = threading.Thread(target=self.run_server)
+        self._server_thread.daemon = True
+        self._server_thread.start()
         
-        logs = []
+        logs = deque(maxlen=LOG_HISTORY)
+        self._pad = curses.newpad(LOG_HISTORY, PAD_WIDTH)
+        self._pad.scrollok(True)
         
+        # Sleep until a key, new logs or a signal arrive. Windows can only select()
+        # on sockets, so there the timeout polls the keyboard; it also catches resizes.
+        sel = selectors.DefaultSelector()
+        if os.name == 'posix':
+            sel.register(sys.stdin, selectors.EVENT_READ)
+        sel.register(self._notify_r, selectors.EVENT_READ)
+        sel.register(self._wakeup_r, selectors.EVENT_READ)
+        try:
+            self.interactive_loop(stdscr, sel, logs)
+        finally:
+            sel.close()
+    
+    def interactive_loop(self, stdscr, sel, logs):
+        """Handle input and new logs until the receiver stops"""
         while self.running:
+            for key, _ in sel.select(timeout=0.1):
+                if key.fileobj is self._wakeup_r:
+                    self.handle_wakeup()
+                elif key.fileobj is self._notify_r:
+                    try:
+                        self._notify_r.recv(4096)
+                    except BlockingIOError:
+                        pass
+            if not self.running:
+                break
+            
             # Handle keyboard input
             try:
                 key = stdscr.getch()
-                if key == ord('q'):
-                    self.running = False
-                    break
-                elif key == ord('t'):
-                    self.show_timestamp = not self.show_timestamp
-                elif key == ord('i'):
-                    self.show_ip = not self.show_ip
-                elif key == ord('p'):
-                    self.show_port = not self.show_port
-                elif key == ord('m'):
-                    self.show_microseconds = not self.show_microseconds
-                elif key == ord('c'):
-                    logs.clear()
+                while key != -1 and self.running:
+                    self.handle_key(key, logs)
+                    key = stdscr.getch()
             except:
                 pass
             
             # Get new logs from queue
             try:
                 while True:
-                    log_entry = self.log_queue.get_nowait()
-                    logs.append(log_entry)
-                    if len(logs) > 1000:  # Keep last 1000 logs
-                        logs.pop(0)
+                    batch = self.log_queue.get_nowait()
+                    logs.extend(batch)
+                    self.append_to_pad(batch)
             except queue.Empty:
                 pass
             
-            # Draw interface
-            self.draw_interface(stdscr, logs)
-            time.sleep(0.1)
+            # Draw interface only when something changed
+            if self._dirty:
+                self.draw_interface(stdscr)
+                self._dirty = False
+    
+    def handle_key(self, key, logs):
+        """Apply one key press"""
+        if key == ord('q'):
+            self.running = False
+        elif key == ord('t'):
+            self.show_timestamp = not self.show_timestamp
+            self.apply_display_settings(logs)
+        elif key == ord('i'):
+            self.show_ip = not self.show_ip
+            self.apply_display_settings(logs)
+        elif key == ord('p'):
+            self.show_port = not self.show_port
+            self.apply_display_settings(logs)
+        elif key == ord('m'):
+            self.show_microseconds = not self.show_microseconds
+            self.apply_display_settings(logs)
+        elif key == ord('c'):
+            logs.clear()
+            self.rebuild_pad(logs)
+        elif key == curses.KEY_RESIZE:
+            self._dirty = True
+    
+    def append_to_pad(self, entries):
+        """Render new log entries below the existing pad content"""
+        if len(entries) > LOG_HISTORY:
+            entries = list(entries)[-LOG_HISTORY:]
+        
+        fmt = self._fmt_fn
+        for log_entry in entries:
+            if self._pad_rows < LOG_HISTORY:
+                row = self._pad_rows
+                self._pad_rows += 1
+            else:
+                self._pad.scroll(1)  # Oldest line falls off the top, like the deque
+                row = LOG_HISTORY - 1
+            try:
+                self._pad.addnstr(row, 0, fmt(*log_entry), PAD_WIDTH - 1)
+            except (curses.error, ValueError):
+                pass
+        self._dirty = True
     
-    def draw_interface(self, stdscr, logs):
+    def apply_display_settings(self, logs):
+        """Pick the formatter for the current toggles and re-render the history"""
+        self._fmt_fn = _DISPLAY_FORMATTERS[self.show_timestamp, self.show_ip,
+                                           self.show_port, self.show_microseconds]
+        self._cached_controls = self.build_controls()
+        self.rebuild_pad(logs)
+    
+    def build_controls(self):
+        """Build the controls lines shown under the header"""
+        return (
+            "Controls: [q]uit | [t]imestamp | [i]p | [p]ort | [m]icroseconds | [c]lear",
+            f"Show: Time:{self.show_timestamp} IP:{self.show_ip} Port:{self.show_port} μs:{self.show_microseconds}"
+        )
+    
+    def rebuild_pad(self, logs):
+        """Re-render every log entry, e.g. after a display toggle"""
+        self._pad.erase()
+        self._pad_rows = 0
+        self.append_to_pad(logs)
+    
+    def draw_interface(self, stdscr):
         """Draw the interactive interface"""
-        stdscr.clear()
+        stdscr.erase()
         height, width = stdscr.getmaxyx()
         
+        if width != self._sep_width:
+            self._sep_width = width
+            self._cached_sep = "-" * (width-1)
+        
         # Header
-        header = f"Log Receiver - {self.host}:{self.port}"
-        stdscr.addstr(0, 0, header[:width-1], curses.A_BOLD)
+        stdscr.addnstr(0, 0, self._cached_header, width-1, curses.A_BOLD)
         
         # Controls
-        controls = [
-            "Controls: [q]uit | [t]imestamp | [i]p | [p]ort | [m]icroseconds | [c]lear",
-            f"Show: Time:{self.show_timestamp} IP:{self.show_ip} Port:{self.show_port} μs:{self.show_microseconds}"
-        ]
-        
-        for i, control in enumerate(controls):
+        for i, control in enumerate(self._cached_controls):
             if i + 1 < height:
-                stdscr.addstr(i + 1, 0, control[:width-1])
+                stdscr.addnstr(i + 1, 0, control, width-1)
         
         # Separator
         if height > 3:
-            stdscr.addstr(3, 0, "-" * (width-1))
+            stdscr.addstr(3, 0, self._cached_sep)
+        stdscr.noutrefresh()
         
-        # Logs
+        # Logs - newest lines at the bottom of the region
         log_start = 4
         visible_logs = height - log_start - 1
         
-        if logs and visible_logs > 0:
-            start_idx = max(0, len(logs) - visible_logs)
-            for i, log_entry in enumerate(logs[start_idx:]):
-                y_pos = log_start + i
-                if y_pos < height - 1:
-                    display_text = self.format_log_entry(log_entry)
-                    stdscr.addstr(y_pos, 0, display_text[:width-1])
-        
-        stdscr.refresh()
-    
-    def format_log_entry(self, log_entry):
-        """Format a log entry based on current display settings"""
-        timestamp, client_addr, message = log_entry
-        
-        parts = []
-        
-        if self.show_timestamp:
-            if self.show_microseconds:
-                time_str = timestamp
-            else:
-                time_str = timestamp.split('.')[0]
-            parts.append(f"[{time_str}]")
-        
-        if self.show_ip or self.show_port:
-            ip, port = client_addr
-            if self.show_ip and self.show_port:
-                parts.append(f"[{ip}:{port}]")
-            elif self.show_ip:
-                parts.append(f"[{ip}]")
-            elif self.show_port:
-                parts.append(f"[:{port}]")
+        if self._pad_rows and visible_logs > 0:
+            top = max(0, self._pad_rows - visible_logs)
+            self._pad.noutrefresh(top, 0, log_start, 0, height - 2, width - 1)
         
-        parts.append(message)
-        return " ".join(parts)
+        curses.doupdate()
     
     def run_server(self):
         """Run the socket server in background thread"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind((self.host, self.port))
-            self.socket.listen(5)
-            
-            while self.running:
-                try:
-                    client_socket, client_addr = self.socket.accept()
-                    
-                    # Handle client in thread
-                    client_thread = threading.Thread(
-                        target=self.handle_client, 
-                        args=(client_socket, client_addr)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                    
-                except socket.error:
-                    if self.running:
-                        break
+            self.open_server_socket()
+            self.run_loop()
         except Exception:
             pass
     
-    def handle_client(self, client_socket, client_addr):
-        """Handle incoming log messages from a client"""
+    def open_server_socket(self):
+        """Create the listening socket"""
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.workers > 1:
+            # Kernel load-balances incoming connections across the workers' sockets
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.socket.bind((self.host, self.port))
+        self.socket.listen(socket.SOMAXCONN)
+        self.socket.setblocking(False)
+    
+    def run_loop(self):
+        """Serve clients via io_uring when requested, otherwise via selectors"""
+        if self.io_uring:
+            try:
+                server = UringServer(self)
+            except OSError as e:
+                if not self.interactive:
+                    self.status(f"io_uring unavailable ({e}), using selectors")
+            else:
+                server.run()
+                return
+        self.serve()
+    
+    def serve(self):
+        """Accept and read all clients from a single selector loop"""
+        # One buffer serves every client since reads happen on this thread only
+        self._recv_view = memoryview(bytearray(RECV_SIZE))
+        sel = selectors.DefaultSelector()
+        sel.register(self.socket, selectors.EVENT_READ)  # data=None marks the listener
+        sel.register(self._wakeup_r, selectors.EVENT_READ)
         try:
             while self.running:
-                # Receive data
-                data = client_socket.recv(4096)
-                if not data:
-                    break
-                    
-                # Process each line
-                message = data.decode('utf-8', errors='replace')
-                for line in message.split('\n'):
-                    line = line.strip()
-                    if line:
-                        self.process_log(line, client_addr)
-                        
-        except socket.error:
-            pass  # Client disconnected
-        except Exception as e:
-            print(f"Client error: {e}")
+                for key, _ in sel.select(timeout=0.1):
+                    if key.fileobj is self._wakeup_r:
+                        self.handle_wakeup()
+                    elif key.data is None:
+                        self.accept_clients(sel)
+                    else:
+                        self.handle_client(sel, key.data)
+                self.report_repeats()
         finally:
+            for key in list(sel.get_map().values()):
+                if key.data is not None:
+                    self.close_client(key.data)
+            sel.close()
+    
+    def accept_clients(self, sel):
+        """Accept every pending connection on the listening socket"""
+        while True:
             try:
-                client_socket.close()
-                print(f"Disconnected from {client_addr[0]}:{client_addr[1]}")
-            except:
+                client_socket, client_addr = self.socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            
+            self.register_client(client_socket, client_addr)
+            client_socket.setblocking(False)
+            sel.register(client_socket, selectors.EVENT_READ,
+                         ClientConnection(client_socket, client_addr))
+    
+    def register_client(self, client_socket, client_addr):
+        """Configure and announce a newly accepted client"""
+        try:
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SO_RCVBUF_SIZE)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+        if not self.interactive:
+            self.status(f"Connection from {client_addr[0]}:{client_addr[1]}")
+    
+    def handle_client(self, sel, conn):
+        """Handle incoming log messages from a readable client"""
+        try:
+            n = conn.sock.recv_into(self._recv_view)
+        except (BlockingIOError, InterruptedError):
+            return
+        except socket.error:
+            n = 0  # Client disconnected
+        
+        if not n or not self.client_data(conn, self._recv_view[:n]):
+            sel.unregister(conn.sock)
+            self.close_client(conn)
+        else:
+            self.quickack(conn)
+    
+    def quickack(self, conn):
+        """ACK the sender immediately so its Nagle buffer is released"""
+        if TCP_QUICKACK is not None:
+            try:
+                conn.sock.setsockopt(socket.IPPROTO_TCP, TCP_QUICKACK, 1)
+            except OSError:
                 pass
     
-    def process_log(self, message, client_addr):
-        """Process a single log message"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    def client_data(self, conn, data):
+        """Process received bytes, returning False if the client should be dropped"""
+        try:
+            data = bytes(data)
+            end = data.rfind(b'\n')
+            if end < 0:
+                # No line completed - only the pending tail grows
+                conn.buf += data
+                if len(conn.buf) >= MAX_LINE_LENGTH:
+                    lines = [bytes(conn.buf)]
+                    conn.buf = bytearray()
+                    self.process_lines(conn, lines)
+                return True
+            
+            lines = data[:end].split(b'\n')
+            if conn.buf:
+                conn.buf += lines[0]
+                lines[0] = bytes(conn.buf)
+            conn.buf = bytearray(data[end + 1:])
+            self.process_lines(conn, lines)
+            return True
+        except Exception as e:
+            self.status(f"Client error: {e}")
+            return False
+    
+    def close_client(self, conn):
+        """Process an unterminated last line and close the connection"""
+        try:
+            if conn.buf:
+                self.process_lines(conn, [conn.buf])
+            if conn.repeat:
+                self.report_repeat(conn)
+        except Exception as e:
+            self.status(f"Client error: {e}")
         
-        # Full log entry (always saved if log_file specified)
-        full_log = f"[{timestamp}] [{client_addr[0]}:{client_addr[1]}] {message}"
+        conn.sock.close()
+        if not self.interactive:
+            self.status(f"Disconnected from {conn.addr[0]}:{conn.addr[1]}")
+    
+    def process_lines(self, conn, lines):
+        """Queue raw lines received in one chunk for the consumer thread"""
+        now = time.time_ns()
+        entries = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            
+            # Collapse runs of identical lines into a count
+            if line == conn.last_line:
+                if not conn.repeat:
+                    conn.repeat_since = time.monotonic()
+                    self._repeating.add(conn)
+                conn.repeat += 1
+                continue
+            if conn.repeat:
+                entries.append(self.repeat_entry(conn, now))
+            conn.last_line = line
+            entries.append((now, conn.addr, conn.prefix, line))
         
-        # Save full log to file if specified
-        if self.log_file:
-            with open(self.log_file, 'a') as f:
-                f.write(full_log + "\n")
+        self.queue_entries(entries)
+    
+    def repeat_entry(self, conn, now):
+        """Build the entry summarising a run of duplicates and reset the count"""
+        entry = (now, conn.addr, conn.prefix,
+                 b"[last message repeated %d times]" % conn.repeat)
+        conn.repeat = 0
+        self._repeating.discard(conn)
+        return entry
+    
+    def report_repeat(self, conn):
+        """Queue the pending duplicate count of a connection"""
+        self.queue_entries([self.repeat_entry(conn, time.time_ns())])
+    
+    def report_repeats(self):
+        """Report duplicate runs that have been pending for REPEAT_REPORT_INTERVAL"""
+        if not self._repeating:
+            return
+        now = time.monotonic()
+        for conn in list(self._repeating):
+            if now - conn.repeat_since >= REPEAT_REPORT_INTERVAL:
+                self.report_repeat(conn)
+    
+    def status(self, text):
+        """Queue a status message so it is written in order with the log lines"""
+        self.queue_entries([(time.time_ns(), None, None, text.encode())])
+    
+    def queue_entries(self, entries):
+        """Hand entries to the consumer thread"""
+        if not entries:
+            return
+        
+        with self._ring_cv:
+            # The deque evicts the oldest entries silently - count them
+            self._dropped += max(0, len(self._ring) + len(entries) - RING_SIZE)
+            self._ring.extend(entries)
+            self._ring_cv.notify()
+    
+    def consume_loop(self):
+        """Write out queued lines, flushing every write_period, until stopped and drained"""
+        last_flush = time.monotonic()
+        while True:
+            with self._ring_cv:
+                self._ring_cv.wait_for(lambda: self._ring or not self._consuming,
+                                       timeout=self.write_period)
+                batch = list(self._ring)
+                self._ring.clear()
+                dropped, self._dropped = self._dropped, 0
+            
+            # Formatting and I/O happen outside the lock
+            if dropped:
+                batch.insert(0, (time.time_ns(), (self.host, self.port),
+                                 f"[{self.host}:{self.port}] ".encode(),
+                                 b"Dropped %d messages: receiver overloaded" % dropped))
+            # Errors are reported per output in write_entries; anything else
+            # must not stop the thread, or lines would be queued but never written
+            try:
+                if batch:
+                    self.write_entries(batch)
+                
+                now = time.monotonic()
+                if now - last_flush >= self.write_period:
+                    self.flush_output()
+                    last_flush = now
+            except Exception as e:
+                self.sink_failed("Writer", e)
+            
+            if not self._consuming and not batch:
+                return
+    
+    def write_entries(self, batch):
+        """Format queued lines for the log file and stdout or the interactive display"""
+        interactive = self.interactive
+        write_full = self._logbuf is not None or (not interactive and self._stdout_ok)
+        iov = self._iov
+        full_logs = []
+        display = []
+        status = []  # (position in full_logs, line) for stdout only
+        last_ns = None
+        
+        for ns, client_addr, client_prefix, message in batch:
+            if client_prefix is None:
+                # Status message - shown as is, not saved to the log file
+                if interactive:
+                    display.append((_fmt_ts(ns).decode('ascii'), self.host, self.port,
+                                    message.decode()))
+                elif self._stdout_ok:
+                    status.append((len(full_logs), message + b"\n"))
+                continue
+            
+            if ns != last_ns:  # Lines of one chunk share a timestamp
+                timestamp = _fmt_ts(ns)
+                stamp = b"[%s] " % timestamp
+                if interactive:
+                    ts_str = timestamp.decode('ascii')
+                last_ns = ns
+            
+            # Full log entry (always saved if log_file specified)
+            if iov is not None:
+                iov += (stamp, client_prefix, message, b"\n")
+                self._iov_bytes += len(stamp) + len(client_prefix) + len(message) + 1
+                if len(iov) + 4 > IOV_MAX or self._iov_bytes >= WRITEV_BYTES:
+                    try:
+                        self.flush_iov()
+                    except OSError as e:
+                        self.sink_failed("Log file", e)
+                    iov = self._iov
+            if write_full:
+                full_logs.append(format_line(timestamp, client_prefix, message))
+            
+            if interactive:
+                # Strict decode takes CPython's ASCII fast path, replace only on bad input
+                try:
+                    text = message.decode()
+                except UnicodeDecodeError:
+                    text = message.decode('utf-8', 'replace')
+                if "\0" in text:
+                    text = text.replace("\0", "\ufffd")  # curses rejects NUL
+                display.append((ts_str, client_addr[0], client_addr[1], text))
         
-        if self.interactive:
-            # Add to queue for interactive display
-            self.log_queue.put((timestamp, client_addr, message))
+        data = b"".join(full_logs)
+        if status:
+            # Splice the status lines into the stdout copy at their positions
+            for pos, line in reversed(status):
+                full_logs.insert(pos, line)
+            out = b"".join(full_logs)
         else:
-            # Simple mode - just print
-            print(full_log)
+            out = data
+        if self._logbuf:
+            try:
+                self._logbuf.write(data)
+            except OSError as e:
+                self.sink_failed("Log file", e)
+        
+        if interactive:
+            # Hand the whole batch to the display in one queue operation
+            self.log_queue.put(display)
+            try:
+                self._notify_w.send(b"\0")
+            except BlockingIOError:
+                pass  # Pair already full, the UI has a wakeup pending
+        elif self._stdout_ok:
+            # Simple mode - buffered write, flushed by consume_loop
+            try:
+                self._stdout.write(out)
+            except OSError as e:
+                self.stdout_failed(e)
+    
+    def flush_iov(self):
+        """Write pending log file fragments with gathered writev() calls"""
+        pending = self._iov
+        self._iov = []
+        self._iov_bytes = 0
+        fd = self._logfh.fileno()
+        while pending:
+            written = os.writev(fd, pending[:IOV_MAX])
+            # Drop the fragments that made it out, trim a partially written one
+            done = 0
+            while done < len(pending) and written >= len(pending[done]):
+                written -= len(pending[done])
+                done += 1
+            pending = pending[done:]
+            if written:
+                pending[0] = memoryview(pending[0])[written:]
+    
+    def flush_output(self):
+        """Flush buffered log output"""
+        if self._stdout_ok:
+            try:
+                self._stdout.flush()
+                self._failed_sinks.discard("Output")
+            except OSError as e:
+                self.stdout_failed(e)
+            except ValueError:
+                pass
+        
+        if self._logfh:
+            try:
+                if self._iov:
+                    self.flush_iov()
+                if self._logbuf:
+                    self._logbuf.flush()
+                if self.fsync:
+                    getattr(os, 'fdatasync', os.fsync)(self._logfh.fileno())
+                self._failed_sinks.discard("Log file")
+            except OSError as e:
+                self.sink_failed("Log file", e)
+            except ValueError:
+                pass
+    
+    def sink_failed(self, sink, e):
+        """Report a write error on stderr, once until the output works again"""
+        if sink in self._failed_sinks:
+            return
+        self._failed_sinks.add(sink)
+        try:
+            sys.stderr.write(f"{sink} error: {e}\n")
+            sys.stderr.flush()
+        except (OSError, ValueError):
+            pass
+    
+    def stdout_failed(self, e):
+        """Report a stdout error, and stop writing there once the reader has gone"""
+        if isinstance(e, BrokenPipeError):
+            self._stdout_ok = False
+        self.sink_failed("Output", e)
     
     def stop(self):
         """Stop the log receiver"""
         self.running = False
+        if self._server_thread and self._server_thread is not threading.current_thread():
+            try:
+                self._wakeup_w.send(b"\0")  # Not a signal number, just wakes its loop
+            except OSError:
+                pass
+            self._server_thread.join()  # Let it flush its clients' last lines
         if self.socket:
             try:
                 self.socket.close()
             except:
                 pass
-        print("Log receiver stopped")
+        with self._ring_cv:
+            self._consuming = False
+            self._ring_cv.notify()
+        if self._consumer_thread and self._consumer_thread is not threading.current_thread():
+            self._consumer_thread.join()
+        self.flush_output()
+        if self._logfh:
+            try:
+                if self._logbuf:
+                    self._logbuf.close()
+                self._logfh.close()
+            except (OSError, ValueError):
+                pass
+            self._logbuf = None
+            self._logfh = None
+        self.reap_workers()
+        if self._old_wakeup_fd is not None and threading.current_thread() is threading.main_thread():
+            signal.set_wakeup_fd(self._old_wakeup_fd)
+            self._old_wakeup_fd = None
+        for sock in (self._wakeup_r, self._wakeup_w, self._notify_r, self._notify_w):
+            if sock:
+                sock.close()
+        if self._stdout_ok:
+            try:
+                self._stdout.write(b"Log receiver stopped\n")
+                self._stdout.flush()
+            except OSError:
+                pass
+    
+    def reap_workers(self):
+        """Stop and wait for forked workers"""
+        for pid in self._children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self._children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self._children = []
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals"""
-    print(f"\nReceived signal {signum}")
-    sys.exit(0)
+    # Deliberately empty: having a Python-level handler is what makes the
+    # interpreter write the signal number to the wakeup fd, and the serving
+    # loops shut down cleanly when they read it
 
 
 def main():
@@ -296,6 +1030,14 @@ def main():
     parser.add_argument('--interactive', '-i', action='store_true', 
                        help='Enable interactive mode (requires curses)')
     parser.add_argument('--log-file', help='Save full logs to file')
+    parser.add_argument('--write-period', type=float, default=0.1,
+                       help='Seconds between flushes of buffered output (default: 0.1)')
+    parser.add_argument('--fsync', action='store_true',
+                       help='fdatasync the log file after every flush')
+    parser.add_argument('--io-uring', action='store_true',
+                       help='Use io_uring for accept/recv (Linux, requires liburing)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes sharing the port via SO_REUSEPORT (simple mode)')
     
     args = parser.parse_args()
     
@@ -304,12 +1046,31 @@ def main():
         print("Interactive mode requires curses module. Install with: pip install windows-curses (Windows) or use system package manager")
         sys.exit(1)
     
+    if args.write_period <= 0:
+        print("--write-period must be greater than 0")
+        sys.exit(1)
+    
+    if args.workers > 1 and args.interactive:
+        print("Interactive mode supports a single worker")
+        sys.exit(1)
+    
+    if args.workers > 1 and not REUSEPORT_AVAILABLE:
+        print("Multiple workers require SO_REUSEPORT and fork(), using a single worker")
+    
+    if args.io_uring and not IO_URING_AVAILABLE:
+        print("io_uring mode requires the liburing module (pip install liburing), using selectors")
+    
     # Handle signals for clean shutdown
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
     # Start receiver
-    receiver = LogReceiver(args.host, args.port, args.interactive, args.log_file)
+    try:
+        receiver = LogReceiver(args.host, args.port, args.interactive, args.log_file,
+                               args.write_period, args.fsync, args.io_uring, args.workers)
+    except OSError as e:
+        print(f"Cannot open log file: {e}")
+        sys.exit(1)
     
     if args.interactive:
         print("Starting interactive mode...")
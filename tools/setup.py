@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Build the optional C formatter used by log_receiver.py
+Usage: cd tools && python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='log_receiver_logfmt',
+    ext_modules=cythonize('_logfmt.pyx'),
+)